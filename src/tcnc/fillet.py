@@ -6,11 +6,16 @@ and preserve toolpath hints.
 
 from __future__ import annotations
 
+import math
+from typing import TYPE_CHECKING
+
 import geom2d
 import geom2d.fillet
 
 from . import toolpath
-from .toolpath import ToolpathArc, ToolpathSegment
+
+if TYPE_CHECKING:
+    from .toolpath import ToolpathArc, ToolpathSegment
 
 _MIN_PATH = 2
 
@@ -44,64 +49,140 @@ def fillet_toolpath(
     if radius < geom2d.const.EPSILON or len(path) < _MIN_PATH:
         return path
 
-    new_path = toolpath.Toolpath()
+    create_fillet = _create_fillet
 
-    seg1 = path[0]
-    for seg2 in path[1:]:
-        new_segs = _create_adjusted_fillet(
-            seg1,
-            seg2,
-            radius,
-            adjust_rotation=adjust_rotation,
-            mark_fillet=mark_fillet,
+    # Segment end point tangents, computed once for the whole path.
+    # Trimming a segment to a fillet doesn't change the tangent at
+    # its other end, so these stay valid as the path is rebuilt.
+    start_angles, end_angles = _tangent_angles(path)
+    # Segment pairs that are already G1 don't need a fillet.
+    # A closed path has an extra joint from the last segment to the first.
+    g1_joints = [
+        _is_g1(path[i - 1], path[i], end_angles[i - 1], start_angles[i])
+        for i in range(1, len(path))
+    ]
+    if fillet_close and path.is_closed():
+        g1_joints.append(
+            _is_g1(path[-1], path[0], end_angles[-1], start_angles[0])
         )
+    if all(g1_joints):
+        # Nothing to fillet
+        return path
+    num_segs = len(path)
+    fillet_close = len(g1_joints) == num_segs
+
+    # Each fillet adds one segment so the new path
+    # can be at most twice as long as the original.
+    new_path = toolpath.Toolpath([None] * (num_segs * 2))
+    n = 0
+
+    # Joints are filleted in order since each fillet trims the segment
+    # that the next fillet has to fit on.
+    seg1 = path[0]
+    seg1_start_angle = start_angles[0]
+    for i, is_g1 in enumerate(g1_joints, 1):
+        # The closing joint connects to the already filleted first segment
+        j = i if i < num_segs else 0
+        seg2 = path[j] if j else new_path[0]
+        new_segs = ()
+        if not is_g1:
+            new_segs = create_fillet(seg1, seg2, radius, mark_fillet)
+            if new_segs and adjust_rotation:
+                _adjust_fillet_rotation(
+                    seg1,
+                    seg2,
+                    new_segs,
+                    (seg1_start_angle, end_angles[i - 1]),
+                    (
+                        start_angles[j],
+                        end_angles[j] if j else seg2.end_tangent_angle(),
+                    ),
+                )
         if new_segs:
-            new_path.extend(new_segs[:-1])
-            seg1 = new_segs[-1]
+            new_path[n] = new_segs[0]
+            new_path[n + 1] = new_segs[1]
+            n += 2
+            seg1 = new_segs[2]
+            # The trimmed segment now starts at the fillet arc
+            seg1_start_angle = (
+                seg1.start_tangent_angle() if adjust_rotation else 0.0
+            )
         else:
-            new_path.append(seg1)
+            new_path[n] = seg1
+            n += 1
             seg1 = seg2
+            seg1_start_angle = start_angles[j]
 
-    new_path.append(seg1)
-
-    # Close the path with a fillet
-    if fillet_close and len(path) > _MIN_PATH and path[0].p1 == path[-1].p2:
-        # geom2d.debug.draw_point(path[0].p1, color='#0000ff')
-        # geom2d.debug.draw_point(path[-1].p2, color='#00ffff')
-        new_segs = _create_adjusted_fillet(
-            new_path[-1],
-            new_path[0],
-            radius,
-            adjust_rotation=adjust_rotation,
-            mark_fillet=mark_fillet,
-        )
-        if new_segs:
-            new_path[-1] = new_segs[0]
-            new_path.append(new_segs[1])
-            new_path[0] = new_segs[2]
+    if fillet_close:
+        # Back at the first segment, which may have been
+        # trimmed at its start by the closing fillet.
+        new_path[0] = seg1
+    else:
+        new_path[n] = seg1
+        n += 1
 
     # Discard the path copy if no fillets were created...
-    return new_path if len(new_path) > len(path) else path
+    if n == len(path):
+        return path
+    del new_path[n:]
+    return new_path
 
 
-def _create_adjusted_fillet(
+def _tangent_angles(
+    path: toolpath.Toolpath,
+) -> tuple[list[float], list[float]]:
+    """Start and end tangent angles of each path segment.
+
+    Returns:
+        A tuple of two lists (start_angles, end_angles)
+        indexed in parallel with the path segments.
+    """
+    start_angles = [seg.start_tangent_angle() for seg in path]
+    end_angles = [seg.end_tangent_angle() for seg in path]
+    return start_angles, end_angles
+
+
+def _is_g1(
+    seg1: ToolpathSegment,
+    seg2: ToolpathSegment,
+    seg1_end_angle: float,
+    seg2_start_angle: float,
+) -> bool:
+    """Same as geom2d.segments_are_g1 but using precomputed tangents."""
+    if not geom2d.point.almost_equal(seg1.p2, seg2.p1):
+        return False
+    if isinstance(seg1, geom2d.Line) and isinstance(seg2, geom2d.Line):
+        # Two lines are G1 if they are collinear and point the same way,
+        # which only needs the cross and dot products of their vectors.
+        (x1, y1), (x2, y2) = seg1
+        (x3, y3), (x4, y4) = seg2
+        dx1 = x2 - x1
+        dy1 = y2 - y1
+        dx2 = x4 - x3
+        dy2 = y4 - y3
+        cross = dx1 * dy2 - dy1 * dx2
+        dot = dx1 * dx2 + dy1 * dy2
+        length2 = (dx1 * dx1 + dy1 * dy1) * (dx2 * dx2 + dy2 * dy2)
+        return dot > 0 and cross * cross < geom2d.const.EPSILON2 * length2
+    return geom2d.float_eq(seg1_end_angle, seg2_start_angle)
+
+
+def _create_fillet(
     seg1: ToolpathSegment,
     seg2: ToolpathSegment,
     radius: float,
-    adjust_rotation: bool = False,
     mark_fillet: bool = False,
 ) -> tuple | tuple[ToolpathSegment, ToolpathArc, ToolpathSegment]:
     """Try to create a fillet between two segments.
 
     Any GCode rendering hints attached to the segments will
     be preserved.
+    The segments are assumed to not already be G1 continuous.
 
     Args:
         seg1: First segment, an Arc or a Line.
         seg2: Second segment, an Arc or a Line.
         radius: Fillet radius.
-        adjust_rotation: If True adjust the A axis rotation hints
-            to compensate for the offset caused by the fillet.
         mark_fillet: If True add an attribute to the fillet arc
             to mark it to ignore G1. Default is False.
 
@@ -109,19 +190,24 @@ def _create_adjusted_fillet(
         A tuple containing the adjusted segments and fillet arc
         (seg1, fillet_arc, seg2),
         or an empty tuple if the segments cannot be connected
-        with a fillet arc (either they are too small, already G1
-        continuous, or are somehow degenerate.)
+        with a fillet arc (either they are too small
+        or are somehow degenerate.)
     """
-    if geom2d.segments_are_g1(seg1, seg2):
-        # geom2d.debug.draw_point(seg2.p1, color='#0000ff')
-        # Segments are already tangentially connected (G1)
+    if isinstance(seg1, geom2d.Line) and isinstance(seg2, geom2d.Line):
+        arc = _line_fillet_arc(seg1, seg2, radius)
+    elif (isinstance(seg1, geom2d.Arc) and seg1.radius < radius) or (
+        isinstance(seg2, geom2d.Arc) and seg2.radius < radius
+    ):
+        # A fillet can't be larger than an arc it is tangent to.
+        # This is checked by geom2d too, but only after computing
+        # the segment tangents.
         return ()
-
-    arc = geom2d.fillet.create_fillet_arc(seg1, seg2, radius)
+    else:
+        arc = geom2d.fillet.create_fillet_arc(seg1, seg2, radius)
     if arc is None:
         return ()
 
-    farc = ToolpathArc(*arc)
+    farc = toolpath.toolpath_segment(arc)
     if mark_fillet:
         # Mark fillet as connecting two possible non-G1 segments
         farc.inline_ignore_g1 = True
@@ -131,32 +217,150 @@ def _create_adjusted_fillet(
         return ()
     fseg1 = toolpath.toolpath_segment(new_segs[0])
     fseg2 = toolpath.toolpath_segment(new_segs[2])
+    return (fseg1, farc, fseg2)
 
-    if adjust_rotation:
-        # Adjust the A axis rotation hints to
-        # compensate for the offset caused by a fillet arc.
-        seg1_start_angle = seg1.start_tangent_angle()
-        seg1_end_angle = seg1.end_tangent_angle()
-        mu = 1.0 - seg1.mu(farc.p1)
-        seg1_offset_angle = (
-            geom2d.calc_rotation(seg1_start_angle, seg1_end_angle) * mu
-        )
-        if not geom2d.is_zero(seg1_offset_angle):
-            fseg1.inline_end_angle = seg1_end_angle - seg1_offset_angle
-            farc.inline_start_angle = fseg1.inline_end_angle
-        else:
-            farc.inline_start_angle = seg1_end_angle
 
-        seg2_start_angle = seg2.start_tangent_angle()
-        seg2_end_angle = seg2.end_tangent_angle()
-        mu = seg2.mu(farc.p2)
-        seg2_offset_angle = (
-            geom2d.calc_rotation(seg2_start_angle, seg2_end_angle) * mu
+def _adjust_fillet_rotation(
+    seg1: ToolpathSegment,
+    seg2: ToolpathSegment,
+    fillet_segs: tuple[ToolpathSegment, ToolpathArc, ToolpathSegment],
+    seg1_angles: tuple[float, float],
+    seg2_angles: tuple[float, float],
+) -> None:
+    """Adjust the A axis rotation hints of a fillet.
+
+    This compensates for the offset caused by a fillet arc.
+
+    Args:
+        seg1: First segment before the fillet was inserted.
+        seg2: Second segment before the fillet was inserted.
+        fillet_segs: Segments returned by _create_fillet.
+        seg1_angles: Start and end tangent angles of the first segment.
+        seg2_angles: Start and end tangent angles of the second segment.
+    """
+    fseg1, farc, fseg2 = fillet_segs
+    seg1_end_angle, farc_start_angle, farc_end_angle, seg2_start_angle = (
+        _fillet_rotation_hints(
+            seg1_angles,
+            seg2_angles,
+            1.0 - _trimmed_fraction(seg1, fseg1),
+            1.0 - _trimmed_fraction(seg2, fseg2),
         )
-        if not geom2d.is_zero(seg2_offset_angle):
-            seg2.inline_start_angle = seg2_start_angle + seg2_offset_angle
-            farc.inline_end_angle = seg2.inline_start_angle
-        else:
-            farc.inline_end_angle = seg2_start_angle
+    )
+    if seg1_end_angle is not None:
+        fseg1.inline_end_angle = seg1_end_angle
+    if seg2_start_angle is not None:
+        seg2.inline_start_angle = seg2_start_angle
+    farc.inline_start_angle = farc_start_angle
+    farc.inline_end_angle = farc_end_angle
 
-    return (fseg1, farc, fseg2)
+
+def _trimmed_fraction(
+    seg: ToolpathSegment, trimmed_seg: ToolpathSegment
+) -> float:
+    """The fraction of a segment that is left after trimming to a fillet.
+
+    The fillet tangent point's unit distance along the segment follows
+    from this, without mapping the point back onto the segment.
+    """
+    if isinstance(seg, geom2d.Arc):
+        # Avoids the atan2 in Arc.mu()
+        return trimmed_seg.angle / seg.angle
+    return trimmed_seg.length() / seg.length()
+
+
+def _line_fillet_arc(  # noqa: PLR0914
+    seg1: geom2d.Line, seg2: geom2d.Line, radius: float
+) -> geom2d.Arc | None:
+    """Create a fillet arc between two connected lines.
+
+    Same as geom2d.fillet.create_fillet_arc for a Line->Line pair,
+    but the fillet tangent points are found directly from the
+    corner angle instead of by intersecting offset lines.
+    """
+    epsilon = geom2d.const.EPSILON
+    (x1, y1), (x2, y2) = seg1
+    x3, y3 = seg2.p2
+    dx1 = x2 - x1
+    dy1 = y2 - y1
+    dx2 = x3 - x2
+    dy2 = y3 - y2
+    len1 = math.hypot(dx1, dy1)
+    len2 = math.hypot(dx2, dy2)
+    cross = dx1 * dy2 - dy1 * dx2
+    if abs(cross) < epsilon * len1 * len2:
+        # Parallel lines
+        return None
+    den = len1 * len2 + dx1 * dx2 + dy1 * dy2
+    if den <= 0:
+        # Cusp: the lines double back on each other
+        return None
+    # Distance from the corner to the fillet tangent points:
+    # radius * tan(theta / 2) where theta is the deflection angle.
+    dist = radius * abs(cross) / den
+    if dist > len1 * (1 + epsilon) or dist > len2 * (1 + epsilon):
+        # The fillet doesn't fit on the segments
+        return None
+    mu1 = min(dist / len1, 1.0)
+    mu2 = min(dist / len2, 1.0)
+    fp1 = geom2d.P(x2 - dx1 * mu1, y2 - dy1 * mu1)
+    fp2 = geom2d.P(x2 + dx2 * mu2, y2 + dy2 * mu2)
+    if fp1 == fp2:
+        return None
+    # The center is on the inside of the corner
+    side = radius / len1 if cross > 0 else -radius / len1
+    center = geom2d.P(fp1.x - dy1 * side, fp1.y + dx1 * side)
+    return geom2d.Arc.from_two_points_and_center(fp1, fp2, center)
+
+
+def _fillet_rotation_hints(
+    seg1_angles: tuple[float, float],
+    seg2_angles: tuple[float, float],
+    seg1_mu: float,
+    seg2_mu: float,
+) -> tuple[float | None, float, float, float | None]:
+    """Compute the A axis rotation hints for a fillet arc.
+
+    This only does arithmetic on floats so that it stays
+    cheap to call for every fillet.
+
+    Args:
+        seg1_angles: Start and end tangent angles of the first segment.
+        seg2_angles: Start and end tangent angles of the second segment.
+        seg1_mu: Unit distance of the fillet start point
+            from the end of the first segment.
+        seg2_mu: Unit distance of the fillet end point
+            from the start of the second segment.
+
+    Returns:
+        A tuple containing the rotation angles
+        (seg1_end, fillet_start, fillet_end, seg2_start).
+        The segment angles are None if they don't need adjusting.
+    """
+    epsilon = geom2d.const.EPSILON
+    calc_rotation = geom2d.calc_rotation
+    seg1_start_angle, seg1_end_angle = seg1_angles
+    seg2_start_angle, seg2_end_angle = seg2_angles
+    seg1_offset_angle = (
+        calc_rotation(seg1_start_angle, seg1_end_angle) * seg1_mu
+    )
+    seg2_offset_angle = (
+        calc_rotation(seg2_start_angle, seg2_end_angle) * seg2_mu
+    )
+    # Offsets that are effectively zero leave the segment angles as is
+    seg1_end = (
+        seg1_end_angle - seg1_offset_angle
+        if abs(seg1_offset_angle) >= epsilon
+        else None
+    )
+    seg2_start = (
+        seg2_start_angle + seg2_offset_angle
+        if abs(seg2_offset_angle) >= epsilon
+        else None
+    )
+    return (
+        seg1_end,
+        seg1_end_angle if seg1_end is None else seg1_end,
+        seg2_start_angle if seg2_start is None else seg2_start,
+        seg2_start,
+    )
@@ -15,19 +15,32 @@ interpreter, but probably works fine for others as well.
 from __future__ import annotations
 
 import datetime
+import functools
 import gettext
 import io
 import logging
 import math
-from collections.abc import Iterable
-from typing import TYPE_CHECKING, TextIO
+from typing import TYPE_CHECKING, BinaryIO, ClassVar, TextIO
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
     import geom2d
     from typing_extensions import TypeAlias
 
 _ = gettext.gettext
 
+
+def N_(message: str) -> str:  # noqa: N802
+    """Mark a string for translation without translating it.
+
+    The string is translated by ``_()`` where it is used.
+    """
+    return message
+
+
+_UTC = datetime.timezone.utc
+
 # Target-specific G codes
 _TARGETS: dict[str, dict] = {
     'default': {
@@ -122,13 +135,24 @@ class GCodeGenerator:
     # Order in which G code parameters are specified in a line of G code
     _GCODE_ORDERED_PARAMS = 'XYZUVWABCIJKRDHLPQSF'
     # Non-modal G codes (LinuxCNC.)
-    _GCODE_NONMODAL_GROUP = ('G04', 'G10', 'G28', 'G30', 'G53', 'G92')
+    _GCODE_NONMODAL_GROUP = frozenset(
+        ('G04', 'G10', 'G28', 'G30', 'G53', 'G92')
+    )
     # G codes where a feed rate is required
-    _GCODE_FEED = ('G01', 'G02', 'G03')
+    _GCODE_FEED = frozenset(('G01', 'G02', 'G03'))
     # G codes that change the position of the tool
-    _GCODE_MOTION = ('G00', 'G01', 'G02', 'G03')
+    _GCODE_MOTION = frozenset(('G00', 'G01', 'G02', 'G03'))
     # G codes that are suppressed if the parameters remain unchanged
-    _GCODE_MODAL_MOTION = ('G00', 'G01', 'G02', 'G03')
+    _GCODE_MODAL_MOTION = frozenset(('G00', 'G01', 'G02', 'G03'))
+    # Position and feed parameters tracked by gcode_command,
+    # in the same order as _GCODE_ORDERED_PARAMS.
+    _GCODE_POSITION_ORDER = 'XYZAIJRF'
+    _GCODE_POSITION_PARAMS = frozenset(_GCODE_POSITION_ORDER)
+    # Machine attribute and header comment for the units G code
+    _GCODE_UNITS: ClassVar[Mapping[str, tuple[str, str]]] = {
+        'mm': ('set_units_mm', N_('Units are in millimeters')),
+        'in': ('set_units_in', N_('Units are in inches')),
+    }
     # Default tolerance for floating point comparison
     _DEFAULT_TOLERANCE = 1e-8
     # Default tolerance for floating point comparison of angle values
@@ -137,6 +161,8 @@ class GCodeGenerator:
     _DEFAULT_PRECISION = 6
     # Default angular feed rate (deg/m)
     _DEFAULT_AFEED = 360
+    # Number of characters to buffer before writing to the output stream
+    _OUTPUT_BUFFER_SIZE = 65536
 
     _disabled_axes: set
     # Target machine.
@@ -152,7 +178,7 @@ class GCodeGenerator:
     # Current line number
     line_number: float = 0
     # The G code output stream
-    output: TextIO
+    output: TextIO | BinaryIO
     # The current preview plotter
     preview_plotter: PreviewPlotter | None = None
     # User to machine unit scale
@@ -162,7 +188,9 @@ class GCodeGenerator:
     # Tolerance for angle comparisons
     angle_tolerance: float = _DEFAULT_ANGLE_TOLERANCE
     # Number of digits precision for output
-    precision: float = _DEFAULT_PRECISION
+    _precision: float = _DEFAULT_PRECISION
+    # Float format spec for the current output precision
+    _float_format: str = f'.{_DEFAULT_PRECISION + 1}f'
     # Delay time in millis for tool-down
     tool_wait_down: float = 0.0
     # Delay time in millis for tool-up
@@ -217,6 +245,18 @@ class GCodeGenerator:
     _is_tool_up: bool = False
     # Flag set when the axis angle has been normalized
     _axis_offset_reset: float = False
+    # Target machine name
+    _target: str
+    # Target machine attributes
+    _target_tbl: dict[str, str | list[str]]
+    # Buffered output text waiting to be written to the output stream
+    _output_buffer: list[str]
+    # Number of characters in the output buffer
+    _output_buffer_len: int = 0
+    # True if output is buffered
+    _output_buffered: bool = False
+    # True if output is a binary stream
+    _output_binary: bool = False
 
     def __init__(
         self,
@@ -224,9 +264,10 @@ class GCodeGenerator:
         zsafe: float | None = None,
         zfeed: float | None = None,
         afeed: float | None = None,
-        output: TextIO | None = None,
+        output: TextIO | BinaryIO | None = None,
         plotter: PreviewPlotter | None = None,
         target: str = 'linuxcnc',
+        buffer_output: bool = False,
     ) -> None:
         """GCodeGenerator constructor.
 
@@ -241,16 +282,28 @@ class GCodeGenerator:
             output: Output stream for generated G code.
                 Must implement ``write()`` method.
                 Defaults to a StringIO if None (default).
+                Binary streams (i.e. files opened with 'wb')
+                receive UTF-8 encoded text.
             plotter: Preview plotter. Should be a subclass of
                 ``gcode.PreviewPlotter``.
             target: Target machine. Default is 'LinuxCNC'.
+            buffer_output: If True, G code is collected in memory and
+                written to `output` in large chunks. The caller must then
+                call :py:meth:`flush()` (or :py:meth:`footer()`, which
+                flushes) when done, otherwise the tail of the
+                output is lost. Default is False.
         """
-        self.target = target.lower()
+        self.target = target
         self.xyfeed = xyfeed
         self.zsafe = zsafe
         self.zfeed = zfeed
         self.afeed = afeed
         self.output = output if output else io.StringIO()
+        self._output_buffer = []
+        self._output_buffered = buffer_output
+        self._output_binary = isinstance(
+            self.output, (io.RawIOBase, io.BufferedIOBase)
+        )
         self.preview_plotter = plotter
         self.header_comments = []
         self.axis_scale = {}
@@ -272,6 +325,26 @@ class GCodeGenerator:
             raise ValueError('Units must be "in" or "mm".')
         self.gc_unit = value
 
+    @property
+    def precision(self) -> float:
+        """Number of digits precision for output."""
+        return self._precision
+
+    @precision.setter
+    def precision(self, value: float) -> None:
+        self._precision = value
+        self._float_format = f'.{value + 1}f'
+
+    @property
+    def target(self) -> str:
+        """Target machine name (lower case)."""
+        return self._target
+
+    @target.setter
+    def target(self, value: str) -> None:
+        self._target = value.lower()
+        self._target_tbl = _TARGETS.get(self._target, _TARGETS['default'])
+
     @property
     def X(self) -> float | None:  # noqa: N802 # pylint: disable=invalid-name
         """The current X axis value or none if unknown."""
@@ -301,12 +374,15 @@ class GCodeGenerator:
         self._disabled_axes.remove(axis.upper())
 
     def machine_attr(self, name: str, default: str | None = None) -> str | None:
-        """Get the machine attribute or machine-specific G code."""
+        """Get the machine attribute or machine-specific G code.
+
+        If the target machine doesn't define the attribute then
+        `default` is returned, or if that is None the value
+        from the default target.
+        """
         if default is None:
             default = _TARGETS['default'].get(name)
-        attr: str | None = _TARGETS.get(self.target, _TARGETS['default']).get(
-            name, default
-        )
+        attr: str | None = self._target_tbl.get(name, default)
         return attr
 
     def set_tolerance(
@@ -341,7 +417,7 @@ class GCodeGenerator:
 
     def fmt_float(self, x: float) -> str:
         """Format a float value to match current output precision."""
-        return f'{x:.{self.precision + 1}f}'
+        return format(x, self._float_format)
 
     def set_units(self, units: str, unit_scale: float = 1.0) -> None:
         """Set G code units and unit scale factor.
@@ -495,24 +571,29 @@ class GCodeGenerator:
                 on a separate line.
         """
         if self.show_comments:
-            if isinstance(comment, str):
+            if comment is None:
+                self._write('\n')
+            elif isinstance(comment, str):
                 self._write_line(comment=comment)
-            elif isinstance(comment, Iterable):
+            else:
                 for comment_line in comment:
                     self._write_line(comment=comment_line)
-            else:
-                self._write('\n')
 
-    def header(self, comment: str | None = None) -> None:
+    def header(
+        self, comment: str | None = None, timestamp: str | None = None
+    ) -> None:
         """Output a pretty standard G code file header.
 
         Args:
             comment: A header comment or a list of comments (optional).
+            timestamp: Creation date string (optional).
+                Defaults to the current local time.
         """
         self._write('%\n')
-        now = datetime.datetime.now(tz=datetime.timezone.utc)
-        today = now.astimezone().isoformat(' ')
-        self.comment(f'Creation date: {today}')
+        if timestamp is None:
+            now = datetime.datetime.now(tz=_UTC)
+            timestamp = now.astimezone().isoformat(' ')
+        self.comment(f'Creation date: {timestamp}')
         self.comment(f'Target machine: {self.machine_attr("description")}')
         self.comment(f'Output precision: {self.fmt_float(self.precision)}')
         self.comment(f'Units: {self.gc_unit}')
@@ -526,12 +607,12 @@ class GCodeGenerator:
                 self.comment(hdr_comment)
         self.comment()
         self._write_line('G17', _('Circular interpolation: XY plane'))
-        if self.units == 'mm':
-            gcode = self.machine_attr('set_units_mm')
-            self._write_line(gcode, comment=_('Units are in millimeters'))
-        else:
-            gcode = self.machine_attr('set_units_in')
-            self._write_line(gcode, comment=_('Units are in inches'))
+        units_attr, units_comment = self._GCODE_UNITS.get(
+            self.units, self._GCODE_UNITS['in']
+        )
+        self._write_line(
+            self.machine_attr(units_attr), comment=_(units_comment)
+        )
 
         self._write_line('G90', _('Use absolute positioning'))
         if self.target == 'linuxcnc':
@@ -574,6 +655,22 @@ class GCodeGenerator:
                 self.gcode_command(gcode, comment='Reset axis offsets to zero')
         self._write_line('M2', _('End program.'))
         self._write('%\n')
+        self.flush()
+
+    def flush(self) -> None:
+        """Write any buffered G code to the output stream.
+
+        This does nothing if output is not buffered.
+        """
+        if self._output_buffer:
+            text = ''.join(self._output_buffer)
+            if self._output_binary:
+                # Encode once per buffered chunk rather than per line
+                self.output.write(text.encode('utf-8'))
+            else:
+                self.output.write(text)
+            self._output_buffer.clear()
+            self._output_buffer_len = 0
 
     def feed_rate(self, feed_rate: float) -> None:
         """Set the specified feed rate.
@@ -584,11 +681,11 @@ class GCodeGenerator:
         Args:
             feed_rate: The feed rate in machine units per minute.
         """
-        if self._last_val['F'] is None or not self.float_eq(
-            feed_rate, self._last_val['F']
-        ):
+        last_val = self._last_val
+        last_feed = last_val['F']
+        if last_feed is None or not _feq(feed_rate, last_feed, self.tolerance):
             self._write_line(f'F{self.fmt_float(feed_rate)}')
-            self._last_val['F'] = feed_rate
+            last_val['F'] = feed_rate
 
     def pause(self, conditional: bool = False, comment: str = 'Pause') -> None:
         """Pause the G code interpreter.
@@ -758,7 +855,7 @@ class GCodeGenerator:
                 # pylint: disable=invalid-unary-operand-type
                 speed = -speed
                 # pylint: enable=invalid-unary-operand-type
-            self._write_line('S{speed:.2f}', comment=comment)
+            self._write_line(f'S{speed:.2f}', comment=comment)
         if wait and wait > 0:
             self.dwell(wait)
 
@@ -797,9 +894,9 @@ class GCodeGenerator:
         if axis not in 'ABC':
             raise GCodeError(_('Can only normalize a rotational axis.'))
         angle = self._last_val[axis]
-        if angle and abs(angle) > 2 * math.pi:
-            # normalize the angle
-            angle = angle - 2 * math.pi * math.floor(angle / 2 * math.pi)
+        if angle and abs(angle) > math.tau:
+            # normalize the angle to [0, 2*pi)
+            angle %= math.tau
             val = self.fmt_float(math.degrees(angle))
             self._write_line(
                 f'G92 {axis}={val}', comment=_('Normalize axis angle')
@@ -866,13 +963,18 @@ class GCodeGenerator:
             feed: Feed rate (optional - default feed rate used if None)
             comment: Optional comment string.
         """
+        if x is None and y is None and z is None and a is None:
+            # A feed rate by itself is never output, so don't
+            # record it as the current feed rate either.
+            return
+
         # Determine default feed rate appropriate for the move
         if feed is None:
             if x is not None or y is not None:
                 feed = self.xyfeed
             elif z is not None:
                 feed = self.zfeed
-            elif a is not None:
+            else:
                 feed = self.afeed
 
         if feed is not None:
@@ -897,14 +999,15 @@ class GCodeGenerator:
         """Perform a *G2*/*G3* arc feed.
 
         This will raise a GCodeError if the beginning and ending arc radii
-        do not match, ie if one of the end points does not lie on the arc.
+        do not match within twice the tolerance,
+        ie if one of the end points does not lie on the arc.
 
         Args:
             clockwise: True if the arc moves in a clockwise direction.
             x: X value of arc end point
             y: Y value of arc end point
-            arc_x: Center of arc relative to ``x``
-            arc_y: Center of arc relative to ``y``
+            arc_x: Center of arc relative to the current X position
+            arc_y: Center of arc relative to the current Y position
             a: A axis value at endpoint (in radians)
             z: Optional Z value of arc end point
             feed: Feed rate (optional - default feed rate used if None)
@@ -915,9 +1018,13 @@ class GCodeGenerator:
         center_x = arc_x + current_x
         center_y = arc_y + current_y
         # Distance from center to current position
-        start_radius = math.hypot(current_x - center_x, current_y - center_y)
-        end_radius = math.hypot(arc_x, arc_y)
-        if not self.float_eq(start_radius, end_radius):
+        start_radius = math.hypot(arc_x, arc_y)
+        # Distance from center to end point
+        end_radius = math.hypot(x - center_x, y - center_y)
+        # The current position lags the caller's by up to the tolerance
+        # on each axis since smaller moves aren't output (or tracked),
+        # so allow for that as well as for rounding in the arc geometry.
+        if not _feq(start_radius, end_radius, self.tolerance * 2):
             logger = logging.getLogger(__name__)
             logger.debug('Degenerate arc:')
             logger.debug(
@@ -960,13 +1067,9 @@ class GCodeGenerator:
             of the form (X, Y). An axis value will be
             zero if the position is unknown.
         """
-        x = self._last_val['X']
-        y = self._last_val['Y']
-        if x is None:
-            x = 0
-        if y is None:
-            y = 0
-        return x, y
+        last_val = self._last_val
+        # None (unknown) and zero both map to 0.0
+        return last_val['X'] or 0.0, last_val['Y'] or 0.0
 
     def get_current_position(self) -> tuple[float | None, ...]:
         """The last known tool position.
@@ -976,12 +1079,8 @@ class GCodeGenerator:
             of the form (X, Y, Z, A). An axis value will be
             None if the position is unknown.
         """
-        return (
-            self._last_val['X'],
-            self._last_val['Y'],
-            self._last_val['Z'],
-            self._last_val['A'],
-        )
+        last_val = self._last_val
+        return (last_val['X'], last_val['Y'], last_val['Z'], last_val['A'])
 
     def position(self, axis: str) -> float | None:
         """The current position of the specified axis.
@@ -998,7 +1097,7 @@ class GCodeGenerator:
             raise GCodeError(f'Undefined axis {axis}')
         return self._last_val[axis]
 
-    def gcode_command(  # pylint: disable=too-many-branches
+    def gcode_command(  # noqa: PLR0914 PLR0915 # pylint: disable=too-many-branches
         self,
         command: str,
         params: str | None = None,
@@ -1037,64 +1136,91 @@ class GCodeGenerator:
         """
         if command is None or not command:
             return
-        command = _canonical_cmd(command)
-        base_cmd = command.split('.')[0]
+        command, base_cmd = _canonical_cmd(command)
         # Make sure motion can be tracked.
-        if command in self._GCODE_MOTION and params:
+        if params and command in self._GCODE_MOTION:
             raise GCodeError('Motion command with opaque parameters.')
         pos_params = {}
+        gcode_is_nonmodal = base_cmd in self._GCODE_NONMODAL_GROUP
+        last_vals = self._last_val
+        disabled_axes = self._disabled_axes
+        axis_scale = self.axis_scale
+        axis_offset = self.axis_offset
+        unit_scale = self.unit_scale
+        tolerance = self.tolerance
+        angle_tolerance = self.angle_tolerance
+        wrap_angles = self.wrap_angles
+        position_params = self._GCODE_POSITION_PARAMS
         # Extract machine position parameters and update
         # internal position coordinates.
-        for k in ('X', 'Y', 'Z', 'I', 'J', 'R', 'A', 'F'):
-            value = kwargs.get(k, kwargs.get(k.lower()))
-            if value is not None and k not in self._disabled_axes:
-                if k in 'ABC':
-                    # Use angle tolerance for comparing angle values
-                    tolerance = self.angle_tolerance
-                    if self.wrap_angles:
-                        value = math.fmod(value, 2 * math.pi)
-                else:
-                    # Otherwise use float tolerance
-                    tolerance = self.tolerance
-                last_val = self._last_val[k]
-                value_has_changed = (
-                    last_val is None or abs(value - last_val) > tolerance
-                )
-                gcode_is_nonmodal = base_cmd in self._GCODE_NONMODAL_GROUP
-                if k in force_value or value_has_changed or gcode_is_nonmodal:
-                    self._last_val[k] = value
-                    # Apply any axis transforms
-                    value *= self.axis_scale.get(k, 1.0)
-                    value += self.axis_offset.get(k, 0.0)
-                    if k in 'ABC':
-                        value = math.degrees(value)
-                    elif k in 'XYZIJ':
-                        # Tool height safety check
-                        if (
-                            k == 'Z'
-                            and self._is_tool_up
-                            and self.zsafe is not None
-                            and value < self.zsafe
-                        ):
-                            self._is_tool_up = False
-                        # Apply unit scale (user/world to machine units)
-                        value *= self.unit_scale
-                    pos_params[k] = value
+        for name, value in kwargs.items():
+            if value is None:
+                continue
+            k = name.upper()
+            if (
+                k not in position_params
+                or k in disabled_axes
+                # Upper case parameter names take precedence
+                or (k != name and k in kwargs)
+            ):
+                continue
+            is_angle = k in 'ABC'
+            new_val = value
+            if is_angle:
+                # Use angle tolerance for comparing angle values
+                tol = angle_tolerance
+                if wrap_angles:
+                    new_val = math.fmod(value, math.tau)
+            else:
+                # Otherwise use float tolerance
+                tol = tolerance
+            last_val = last_vals[k]
+            if last_val is None:
+                value_has_changed = True
+            else:
+                delta = new_val - last_val
+                if is_angle and wrap_angles:
+                    # Smallest signed angular difference, so that
+                    # equivalent wrapped angles are not output again.
+                    delta = math.remainder(delta, math.tau)
+                value_has_changed = not -tol <= delta <= tol
+            # force_value is a short string of single letter parameter
+            # names so a substring test is as fast as a set lookup.
+            if value_has_changed or gcode_is_nonmodal or k in force_value:
+                last_vals[k] = new_val
+                # Apply any axis transforms
+                gc_val = new_val * axis_scale.get(k, 1.0)
+                gc_val += axis_offset.get(k, 0.0)
+                if is_angle:
+                    gc_val = math.degrees(gc_val)
+                elif k in 'XYZIJ':
+                    # Tool height safety check
+                    if (
+                        k == 'Z'
+                        and self._is_tool_up
+                        and self.zsafe is not None
+                        and gc_val < self.zsafe
+                    ):
+                        self._is_tool_up = False
+                    # Apply unit scale (user/world to machine units)
+                    gc_val *= unit_scale
+                pos_params[k] = gc_val
 
         gcode_line = None
         if len(pos_params) > 0:
             # Suppress redundant feedrate-only lines
             if len(pos_params) > 1 or 'F' not in pos_params:
-                line_parts = [
-                    command,
-                ]
+                axis_map = self.axis_map
+                fmt_float = self.fmt_float
+                # Lines are short (usually two to four parameters) so
+                # appending to the string is cheaper than a list join.
+                gcode_line = command
                 # Arrange the parameters in a readable order
-                for k in self._GCODE_ORDERED_PARAMS:
+                for k in self._GCODE_POSITION_ORDER:
                     value = pos_params.get(k)
                     if value is not None:
-                        kk = self.axis_map.get(k, k)
-                        line_parts.append(f'{kk}{self.fmt_float(value)}')
-                gcode_line = ' '.join(line_parts)
+                        kk = axis_map.get(k, k)
+                        gcode_line += f' {kk}{fmt_float(value)}'
         # Note: this check will suppress output of modal commands
         # with unchanged parameter values.
         elif base_cmd not in self._GCODE_MODAL_MOTION:
@@ -1112,21 +1238,31 @@ class GCodeGenerator:
         A newline character is always appended, even if the string is empty.
         Empty lines and comment-only lines are not numbered.
         """
+        # The line is composed here so that it costs one _write() call.
         if line:
             if self.show_line_numbers:
-                self._write(f'N{self.line_number:06d} ')
+                line = f'N{self.line_number:06d} {line}'
                 self.line_number += 1
-            self._write(line)
-
-        if self.show_comments and comment:
-            sp = '  ' if line else ''
-            self._write(f'{sp}; {comment}')
-
-        self._write('\n')
+            if self.show_comments and comment:
+                self._write(f'{line}  ; {comment}\n')
+            else:
+                self._write(f'{line}\n')
+        elif self.show_comments and comment:
+            self._write(f'; {comment}\n')
+        else:
+            self._write('\n')
 
     def _write(self, text: str) -> None:
         """Write the string to the gcode output stream."""
-        self.output.write(text)
+        if self._output_buffered:
+            self._output_buffer.append(text)
+            self._output_buffer_len += len(text)
+            if self._output_buffer_len >= self._OUTPUT_BUFFER_SIZE:
+                self.flush()
+        elif self._output_binary:
+            self.output.write(text.encode('utf-8'))
+        else:
+            self.output.write(text)
 
     def _endp(
         self, x: float | None, y: float | None, z: float | None, a: float | None
@@ -1135,35 +1271,49 @@ class GCodeGenerator:
 
         Used for preview plotting.
         """
-        return (
-            x if x is not None else self._last_val_checked('X'),
-            y if y is not None else self._last_val_checked('Y'),
-            z if z is not None else self._last_val_checked('Z'),
-            a if a is not None else self._last_val_checked('A'),
-        )
-
-    def _last_val_checked(self, axis: str) -> float:
-        v: float | None = self._last_val.get(axis)
-        if v is None:
-            raise ValueError(f'Undefined {axis} axis value.')
-        return v
-
-    def float_eq(self, a: float, b: float) -> float:
+        last_val = self._last_val
+        if x is None:
+            x = last_val['X']
+        if y is None:
+            y = last_val['Y']
+        if z is None:
+            z = last_val['Z']
+        if a is None:
+            a = last_val['A']
+        if x is None or y is None or z is None or a is None:
+            # Report the first undefined axis
+            for axis, v in zip('XYZA', (x, y, z, a)):
+                if v is None:
+                    raise ValueError(f'Undefined {axis} axis value.')
+        return (x, y, z, a)
+
+    def float_eq(self, a: float, b: float) -> bool:
         """Compare two floats for approximate equality.
 
         Uses the tolerance specified for the GCodeGenerator class.
         """
-        return abs(a - b) < self.tolerance
+        return _feq(a, b, self.tolerance)
 
 
-def _canonical_cmd(cmd: str) -> str:
+def _feq(a: float, b: float, tolerance: float) -> bool:
+    """True if `a` and `b` differ by less than `tolerance`."""
+    return -tolerance < a - b < tolerance
+
+
+@functools.lru_cache(maxsize=256)
+def _canonical_cmd(cmd: str) -> tuple[str, str]:
     """Canonicalize a G code command.
 
     Converts to upper case...
+
+    Returns:
+        A tuple containing the canonical command and the
+        base command without any subcode (ie. G92 for G92.1).
     """
     # Converts to upper case and expands shorthand (ie. G1 to G01).
     # cmd = cmd.upper()
     # if len(cmd) == 2 and cmd[1].isdigit():
     #    cmd = cmd[0] + '0' + cmd[1]
     # return cmd
-    return cmd.upper()
+    cmd = cmd.upper()
+    return cmd, cmd.split('.')[0]
@@ -7,7 +7,6 @@ import math
 from typing import TYPE_CHECKING, ClassVar
 
 import geom2d
-from geom2d import polygon
 
 from . import gcode
 
@@ -48,6 +47,10 @@ class SVGPreviewPlotter(gcode.PreviewPlotter):
     toolmark_line_interval: float = 0
     # Tool mark interval for in place rotation. In radians.
     toolmark_rotation_interval: float = _DEFAULT_TOOLMARK_INTERVAL_ANGLE
+    # Space tool marks by rotation as well as travel so that
+    # the tool rotation along short segments is shown.
+    # Off by default since it adds tool marks to the preview.
+    adaptive_toolmarks: bool = False
     show_toolmarks: bool = False
     show_tm_outline: bool = False
     incr_layer_suffix: bool = True
@@ -71,13 +74,20 @@ class SVGPreviewPlotter(gcode.PreviewPlotter):
     toolmarks: list[geom2d.Line]
     # Toolpath segments associated with toolmarks
     toolmark_segments: list[geom2d.Line | geom2d.Arc]
+    # Endpoints (x1, y1, x2, y2) of the last tool mark in this tool path
+    _last_toolmark: tuple[float, float, float, float] | None = None
+    # Tool mark lines not yet drawn, keyed by style name.
+    # These are drawn as a single SVG path per style.
+    _pending_marks: dict[str, list[tuple[geom2d.P, geom2d.P]]]
 
     # Current XYZA location
     _current_xy = geom2d.P(0.0, 0.0)
     _current_z = 0.0
     _current_a = 0.0
 
-    _styles: ClassVar[dict] = {
+    # CSS styles used for rendering, resolved from the templates.
+    _styles: dict[str, str]
+    _style_templates: ClassVar[dict] = {
         'toolpath_end_marker': (
             'fill-rule:evenodd;fill:$feedline_stroke;'
             'stroke:none;marker-start:none'
@@ -232,10 +242,11 @@ class SVGPreviewPlotter(gcode.PreviewPlotter):
         self.flip_y_axis = flip_y_axis
 
         # Initialize CSS styles used for rendering
+        # Note: the class template dicts are shared and must not be modified.
         style_scale_values = self._style_scale_defaults[style_scale]
-        self._style_defaults.update(style_scale_values)
-        self._styles.update(
-            self.svg.styles_from_templates(self._styles, self._style_defaults)
+        style_defaults = {**self._style_defaults, **style_scale_values}
+        self._styles = self.svg.styles_from_templates(
+            self._style_templates, style_defaults
         )
 
         # Create layers that will contain the G code preview
@@ -272,21 +283,28 @@ class SVGPreviewPlotter(gcode.PreviewPlotter):
         # Non-offset tangent lines - used to make offset lines
         self.toolmarks = []
         self.toolmark_segments = []
+        self._pending_marks = {'tooloffset': [], 'toolmark': []}
 
     def plot_move(self, endp: gcode.TCoord) -> None:
         """Plot G00 - rapid move from current position to :endp:(x,y,z,a)."""
+        self._flush_tool_marks()
         self.svg.create_line(self._current_xy, endp, self._styles['moveline'])
         self._update_location(endp)
 
     def plot_feed(self, endp: gcode.TCoord) -> None:
         """Plot G01 - linear feed from current position to :endp:(x,y,z,a)."""
-        if self.show_toolmarks:
+        xy_moved = self._current_xy.distance(endp) > geom2d.const.EPSILON
+        # Z only moves don't need tool marks since the tool
+        # hasn't moved or rotated.
+        if self.show_toolmarks and (
+            xy_moved or not geom2d.float_eq(endp[3], self._current_a)
+        ):
             self._draw_tool_marks(
                 geom2d.Line(self._current_xy, endp),
                 start_angle=self._current_a,
                 end_angle=endp[3],
             )
-        if self._current_xy.distance(endp) > geom2d.const.EPSILON:
+        if xy_moved:
             self.svg.create_line(
                 self._current_xy, endp, self._styles['feedline']
             )
@@ -298,12 +316,11 @@ class SVGPreviewPlotter(gcode.PreviewPlotter):
         """Plot G02/G03 - arc feed from current position to :endp:(x,y,z,a)."""
         center = geom2d.P(center)
         radius = center.distance(self._current_xy)
-        # assert(self.gc.float_eq(center.distance(endp), radius))
+        end_radius = center.distance(endp)
+        # assert(self.gc.float_eq(end_radius, radius))
         assert self.gc
-        if not self.gc.float_eq(center.distance(endp), radius):
-            logging.getLogger(__name__).debug(
-                'Degenerate arc: d1=%f, d2=%f', center.distance(endp), radius
-            )
+        if not self.gc.float_eq(end_radius, radius):
+            logger.debug('Degenerate arc: d1=%f, d2=%f', end_radius, radius)
 
         # Draw the tool marks
         if self.show_toolmarks:
@@ -324,21 +341,24 @@ class SVGPreviewPlotter(gcode.PreviewPlotter):
         # This should signal the start of a tool path.
         #        logger.debug('tool down')
         #        geom2d.debug.draw_point(self._current_xy, color='#00ff00')
+        self._flush_tool_marks()
         self.toolmarks = []
         self.toolmark_segments = []
+        self._last_toolmark = None
 
     def plot_tool_up(self) -> None:
         """Plot the end of a tool path."""
         # This should signal the end of a tool path.
         # logger.debug('tool up')
         # geom2d.debug.draw_point(self._current_xy, color='#ff0000')
+        self._flush_tool_marks()
         # Just finish up by drawing the approximate tool path outline.
         if self.show_tm_outline and self.tool_layer is not None:
             self._draw_toolmark_outline()
         if self.x_subpath_render:
             self._draw_subpaths()
 
-    def _draw_tool_marks(
+    def _draw_tool_marks(  # noqa: PLR0912 PLR0914
         self,
         segment: geom2d.Line | geom2d.Arc,
         start_angle: float,
@@ -347,55 +367,137 @@ class SVGPreviewPlotter(gcode.PreviewPlotter):
         """Draw marks showing the angle and travel of the tangential tool."""
         seglen = segment.length()
         rotation = end_angle - start_angle
+        num_rotation_markers = int(
+            abs(rotation) / self.toolmark_rotation_interval
+        )
         if seglen > 0:
             num_markers = int(seglen / self.toolmark_line_interval)
-            num_markers = max(1, num_markers)
+            if self.adaptive_toolmarks:
+                num_markers = max(num_markers, num_rotation_markers)
         else:
-            num_markers = int(abs(rotation) / self.toolmark_rotation_interval)
-            num_markers = max(1, num_markers)
+            num_markers = num_rotation_markers
+        num_markers = max(1, num_markers)
         angle_incr = rotation / num_markers
         point_incr = 1.0 / num_markers
+        # Sample all the tool mark positions along the segment first.
+        # Points are computed directly, with the same arithmetic as
+        # Line.point_at and Arc.point_at, so that the per segment
+        # values (deltas, arc start angle) are only computed once.
+        mu_max = 1.0 + geom2d.const.EPSILON
+        samples: list[tuple[geom2d.P, float]] = []
         angle = start_angle
         u = 0.0
-        while u < (1.0 + geom2d.const.EPSILON):
-            self._draw_tool_mark(segment, u, angle)
-            angle += angle_incr
-            u += point_incr
-
-    def _draw_tool_mark(
-        self, segment: geom2d.Line | geom2d.Arc, u: float, angle: float
+        if isinstance(segment, geom2d.Line):
+            (x1, y1), (x2, y2) = segment
+            dx = x2 - x1
+            dy = y2 - y1
+            while u < mu_max:
+                samples.append((geom2d.P(x1 + dx * u, y1 + dy * u), angle))
+                angle += angle_incr
+                u += point_incr
+        else:
+            arc_p1, arc_p2, radius, sweep_angle, (cx, cy) = segment
+            abs_sweep = abs(sweep_angle)
+            p1_angle = math.atan2(arc_p1[1] - cy, arc_p1[0] - cx)
+            while u < mu_max:
+                arc_angle = abs_sweep * u
+                if arc_angle <= 0.0:
+                    p = arc_p1
+                elif arc_angle >= abs_sweep:
+                    p = arc_p2
+                else:
+                    if sweep_angle < 0:
+                        arc_angle = p1_angle - arc_angle
+                    else:
+                        arc_angle = p1_angle + arc_angle
+                    p = geom2d.P(
+                        cx + radius * math.cos(arc_angle),
+                        cy + radius * math.sin(arc_angle),
+                    )
+                samples.append((p, angle))
+                angle += angle_incr
+                u += point_incr
+
+        for p, angle in samples:
+            self._draw_tool_mark(segment, p, angle)
+
+    def _draw_tool_mark(  # noqa: PLR0914
+        self, segment: geom2d.Line | geom2d.Arc, p: geom2d.P, angle: float
     ) -> None:
-        """Draw the tool mark as a simple T shape."""
-        # This will be the midpoint of the tool mark line.
-        p = segment.point_at(u)
+        """Draw the tool mark as a simple T shape.
+
+        Args:
+            segment: The toolpath segment being marked.
+            p: The tool location on the segment.
+                This will be the midpoint of the tool mark line.
+            angle: The tool angle.
+        """
         assert self.gc
+        # Tool direction unit vector. The offset and the tool mark
+        # directions are this vector rotated by PI and +/-PI/2.
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
         if not self.gc.float_eq(self.tool_offset, 0):
             # Calculate and draw the tool offset mark.
-            px = p + geom2d.P.from_polar(self.tool_offset, angle - math.pi)
+            offset = self.tool_offset
+            px = geom2d.P(p[0] - offset * cos_a, p[1] - offset * sin_a)
             if self.show_toolmarks:
-                self.svg.create_line(
-                    p, px, self._styles['tooloffset'], parent=self.tool_layer
-                )
+                self._pending_marks['tooloffset'].append((p, px))
         else:
             # No tool offset
             px = p
         # Calculate the endpoints of the tool mark.
         r = self.tool_width / 2
-        p1 = px + geom2d.P.from_polar(r, angle + math.pi / 2)
-        p2 = px + geom2d.P.from_polar(r, angle - math.pi / 2)
-        toolmark_line = geom2d.Line(p1, p2)
+        x, y = px
+        x1 = x - r * sin_a
+        y1 = y + r * cos_a
+        x2 = x + r * sin_a
+        y2 = y - r * cos_a
+        p1 = geom2d.P(x1, y1)
+        p2 = geom2d.P(x2, y2)
         # if not self.toolmarks or not toolmark_line.is_coincident(
         #    self.toolmarks[-1]
         # ):
-        if self.show_toolmarks and (
-            not self.toolmarks or toolmark_line != self.toolmarks[-1]
-        ):
-            self.svg.create_line(
-                p1, p2, self._styles['toolmark'], parent=self.tool_layer
-            )
-        # Save toolmarks for toolpath outline and sub-path creation
-        self.toolmarks.append(toolmark_line)
-        self.toolmark_segments.append(segment)
+        if self.show_toolmarks:
+            # Skip the mark if it's the same as the previous one.
+            # Compares the endpoints in order, same as P.__eq__.
+            is_new_mark = True
+            if self._last_toolmark:
+                eps2 = geom2d.const.EPSILON * geom2d.const.EPSILON
+                lx1, ly1, lx2, ly2 = self._last_toolmark
+                dx1 = x1 - lx1
+                dy1 = y1 - ly1
+                dx2 = x2 - lx2
+                dy2 = y2 - ly2
+                is_new_mark = (
+                    dx1 * dx1 + dy1 * dy1 >= eps2
+                    or dx2 * dx2 + dy2 * dy2 >= eps2
+                )
+            if is_new_mark:
+                self._pending_marks['toolmark'].append((p1, p2))
+        self._last_toolmark = (x1, y1, x2, y2)
+        # Save toolmarks for toolpath outline and sub-path creation.
+        # They aren't used otherwise and can get large.
+        if self.show_tm_outline or self.x_subpath_render:
+            self.toolmarks.append(geom2d.Line(p1, p2))
+            self.toolmark_segments.append(segment)
+
+    def _flush_tool_marks(self) -> None:
+        """Draw the pending tool marks.
+
+        All the marks with the same style are drawn as one SVG path
+        instead of a path element per mark.
+        """
+        for style_name, marks in self._pending_marks.items():
+            if marks:
+                # Each mark is an open two point polygon, i.e. a subpath
+                self.svg.create_polygons(
+                    marks,
+                    close_polygon=False,
+                    style=self._styles[style_name],
+                    parent=self.tool_layer,
+                )
+                marks.clear()
 
     def _draw_toolmark_outline(self) -> None:
         """Draw an approximation of the tangent toolpath outline."""
@@ -413,10 +515,8 @@ class SVGPreviewPlotter(gcode.PreviewPlotter):
                     geom2d.debug.draw_point(p, color='#ff0000')
                 prev_toolmark = toolmark
 
-        p1s, p2s = zip(*self.toolmarks)
-        points_1 = list(p1s)
-        points_2 = list(p2s)
-        points_2.reverse()
+        points_1 = [toolmark.p1 for toolmark in self.toolmarks]
+        points_2 = [toolmark.p2 for toolmark in reversed(self.toolmarks)]
         side_1 = _make_outline_path(points_1)
         side_2 = _make_outline_path(points_2)
         if not side_1 or not side_2:
@@ -450,11 +550,18 @@ class SVGPreviewPlotter(gcode.PreviewPlotter):
         offset = self.x_subpath_offset
         # All toolmark lines are the same length, so use the first one
         length = self.toolmarks[0].length()
+        # Start point, direction, and length of each toolmark line.
+        # These don't change between offsets.
+        lines = [
+            (x1, y1, x2 - x1, y2 - y1, math.hypot(x2 - x1, y2 - y1))
+            for (x1, y1), (x2, y2) in self.toolmarks
+        ]
         while offset < length:
-            offset_pts = []
-            for line in self.toolmarks:
-                p = line.point_at(offset / line.length())
-                offset_pts.append(p)
+            # Same as line.point_at(offset / line.length())
+            offset_pts = [
+                geom2d.P(x1 + dx * (offset / d), y1 + dy * (offset / d))
+                for x1, y1, dx, dy, d in lines
+            ]
             path = _make_outline_path(offset_pts)
             path = _simplify_path(path, self.x_subpath_maxdist)
             smooth_path = geom2d.bezier.smooth_path(
@@ -474,19 +581,37 @@ class SVGPreviewPlotter(gcode.PreviewPlotter):
 
 
 def _make_outline_path(points: Sequence[geom2d.TPoint]) -> list[geom2d.Line]:
+    # The duplicate point and collinearity tests are inlined on floats
+    # since this is called for every outline side and subpath.
+    # Note: P doesn't override __ne__ so the duplicate test is
+    # tuple.__ne__, an exact compare, not P.__eq__.
+    # The collinearity test is Line.which_side(inline=True).
+    # A line is only created once the next node isn't inline with it.
+    eps = geom2d.const.EPSILON
     path: list[geom2d.Line] = []
     prev_pt = points[0]
+    px, py = prev_pt
+    # Current (pending) line
+    start_pt = end_pt = None
+    x1 = y1 = x2 = y2 = 0.0
     for next_pt in points[1:]:
-        if next_pt != prev_pt:
+        nx, ny = next_pt
+        if nx != px or ny != py:
             # TODO: use toolmark_segments to determine line/arc
             # Simplify the outline by skipping inline nodes.
-            if path and path[-1].which_side(next_pt, inline=True) == 0:
-                prev_line = path.pop()
-                next_line = geom2d.Line(prev_line.p1, next_pt)
-            else:
-                next_line = geom2d.Line(prev_pt, next_pt)
-            path.append(next_line)
+            if start_pt is None or not (
+                -eps < (x2 - x1) * (ny - y1) - (y2 - y1) * (nx - x1) < eps
+            ):
+                if start_pt is not None:
+                    path.append(geom2d.Line(start_pt, end_pt))
+                start_pt = prev_pt
+                x1, y1 = px, py
+            end_pt = next_pt
+            x2, y2 = nx, ny
         prev_pt = next_pt
+        px, py = nx, ny
+    if start_pt is not None:
+        path.append(geom2d.Line(start_pt, end_pt))
     # path = _fix_intersections(path)
     # path = _fix_reversals(path)
     return path
@@ -495,11 +620,9 @@ def _make_outline_path(points: Sequence[geom2d.TPoint]) -> list[geom2d.Line]:
 def _simplify_path(
     path: Sequence[geom2d.Line], tolerance: float
 ) -> list[geom2d.Line]:
-    points1, points2 = (list(points) for points in zip(*path))
-    # points1 = list(points1)
-    # points2 = list(points2)
-    points1.append(points2[-1])
-    points = polygon.simplify_polyline_rdp(points1, tolerance)
+    points1 = [line.p1 for line in path]
+    points1.append(path[-1].p2)
+    points = _simplify_polyline_rdp(points1, tolerance)
     new_path = []
     prev_pt = points[0]
     for next_pt in points[1:]:
@@ -509,6 +632,68 @@ def _simplify_path(
     return new_path
 
 
+def _simplify_polyline_rdp(  # noqa: PLR0914
+    points: Sequence[geom2d.TPoint], tolerance: float
+) -> list[geom2d.P]:
+    """Simplify a polyline using the Ramer-Douglas-Peucker algorithm.
+
+    Same result as polygon.simplify_polyline_rdp() but iterative and
+    with the point to chord distances computed inline on floats,
+    since subpaths can have thousands of vertices.
+    """
+    num_points = len(points)
+    if num_points < 3:  # noqa: PLR2004
+        return [geom2d.P(p) for p in points]
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    eps2 = geom2d.const.EPSILON2
+    hypot = math.hypot
+    # Indices of the vertices that are kept
+    keep = [0]
+    # Sub-polylines to simplify, as (first, last) vertex index.
+    # The first half of a split is processed first to keep the order.
+    stack = [(0, num_points - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo < 2:  # noqa: PLR2004
+            keep.append(hi)
+            continue
+        # Find the vertex farthest from the chord (segment)
+        # connecting the endpoints of the sub-polyline.
+        x1 = xs[lo]
+        y1 = ys[lo]
+        x2 = xs[hi]
+        y2 = ys[hi]
+        vx = x2 - x1
+        vy = y2 - y1
+        vlen2 = vx * vx + vy * vy
+        dmax = 0.0
+        dmax_index = 0
+        for i in range(lo + 1, hi):
+            x = xs[i]
+            y = ys[i]
+            u = 0 if vlen2 < eps2 else (vx * (x - x1) + vy * (y - y1)) / vlen2
+            if u <= 0:
+                d = hypot(x1 - x, y1 - y)
+            elif u >= 1.0:
+                d = hypot(x2 - x, y2 - y)
+            else:
+                d = hypot(x1 + vx * u - x, y1 + vy * u - y)
+            if d > dmax:
+                dmax_index = i
+                dmax = d
+        if dmax <= tolerance:
+            # All the vertices between the chord endpoints are
+            # within tolerance so they are eliminated.
+            keep.append(hi)
+        elif hi - lo == 2:  # noqa: PLR2004
+            # Can't sub-divide any further
+            keep.extend((lo + 1, hi))
+        else:
+            stack.extend(((dmax_index, hi), (lo, dmax_index)))
+    return [geom2d.P(xs[i], ys[i]) for i in keep]
+
+
 def _fix_intersections(path: Sequence[geom2d.Line]) -> Sequence[geom2d.Line]:
     """Collapse self-intersecting loops."""
     # See: https://en.wikipedia.org/wiki/Bentley-Ottmann_algorithm
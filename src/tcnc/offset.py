@@ -126,8 +126,15 @@ def offset_arc(
     """Offset the arc by the specified offset."""
     start_angle = arc.start_tangent_angle()
     end_angle = arc.end_tangent_angle()
-    p1 = arc.p1 + geom2d.P.from_polar(offset, start_angle)
-    p2 = arc.p2 + geom2d.P.from_polar(offset, end_angle)
+    # Same as arc.p1 + P.from_polar(offset, start_angle), etc.
+    # without the intermediate points.
+    (x1, y1), (x2, y2) = arc.p1, arc.p2
+    p1 = geom2d.P(
+        x1 + offset * math.cos(start_angle), y1 + offset * math.sin(start_angle)
+    )
+    p2 = geom2d.P(
+        x2 + offset * math.cos(end_angle), y2 + offset * math.sin(end_angle)
+    )
     radius = math.hypot(offset, arc.radius)
     o_arc = toolpath.ToolpathArc(p1, p2, radius, arc.angle, arc.center)
     o_arc.inline_start_angle = start_angle
@@ -221,10 +228,12 @@ def smoothing_arcs(
             ],
             seg1.p2,
         )
+    toolpath_biarcs = [toolpath.toolpath_segment(s) for s in biarc_segs]
     # Compute total arc length of biarc approximation
+    seg_lengths = [seg.length() for seg in toolpath_biarcs]
     biarc_length: float = 0
-    for seg in biarc_segs:
-        biarc_length += seg.length()
+    for seg_length in seg_lengths:
+        biarc_length += seg_length
     # Fix inline rotation hints for each new arc segment.
     a_start = toolpath.seg_start_angle(seg1)
     a_end = a_start
@@ -232,11 +241,9 @@ def smoothing_arcs(
         toolpath.seg_end_angle(seg1) - a_start, center=0.0
     )
     sweep_scale = sweep / biarc_length
-    toolpath_biarcs: list[toolpath.ToolpathSegment] = []
-    for seg in [toolpath.toolpath_segment(s) for s in biarc_segs]:
-        a_end = a_start + (seg.length() * sweep_scale)
+    for seg, seg_length in zip(toolpath_biarcs, seg_lengths):
+        a_end = a_start + (seg_length * sweep_scale)
         seg.inline_start_angle = a_start
         seg.inline_end_angle = a_end
         a_start = a_end
-        toolpath_biarcs.append(seg)
     return (toolpath_biarcs, cp1)
@@ -68,46 +68,55 @@ class PaintCAM(simplecam.SimpleCAM):
         """
         toolpaths = super().postprocess_toolpaths(toolpaths)
 
-        for path in toolpaths:
-            if self.options.brush_landing > self.gc.tolerance:
-                self._prepend_landing(path)
+        add_landing = self.options.brush_landing > self.gc.tolerance
+        add_takeoff = self.options.brush_takeoff > self.gc.tolerance
+        if add_landing or add_takeoff:
+            for path in toolpaths:
+                if add_landing:
+                    self._prepend_landing(path)
 
-            if self.options.brush_takeoff > self.gc.tolerance:
-                self._append_takeoff(path)
+                if add_takeoff:
+                    self._append_takeoff(path)
 
         return toolpaths
 
     def generate_rapid_move(self, path: toolpath.Toolpath) -> None:
         """Generate G code for a rapid move to the beginning of the tool path."""
+        options = self.options
         if (
-            self.options.brush_reload_enable
-            # and (self._path_count % self.options.brush_reload_max_paths) == 0
+            options.brush_reload_enable
+            # and (self._path_count % options.brush_reload_max_paths) == 0
         ):
-            start_segment = path[0]
-            if self.options.brush_reload_rotate:
+            gc = self.gc
+            x, y = path[0].p1
+            if options.brush_reload_rotate:
                 # Coordinated move to XY and A reload angle
                 rotation = geom2d.calc_rotation(
-                    self.current_angle, self.options.brush_reload_angle
+                    self.current_angle, options.brush_reload_angle
                 )
                 self.current_angle += rotation
-                self.gc.rapid_move(
-                    start_segment.p1.x, start_segment.p1.y, a=self.current_angle
-                )
+                gc.rapid_move(x, y, a=self.current_angle)
             else:
-                self.gc.rapid_move(start_segment.p1.x, start_segment.p1.y)
-            if self.options.brush_pause_resume:
-                self.gc.pause()
-            elif self.options.brush_reload_dwell > 0:
-                self.gc.dwell(self.options.brush_reload_dwell)
+                gc.rapid_move(x, y)
+            if options.brush_pause_resume:
+                gc.pause()
+            elif options.brush_reload_dwell > 0:
+                gc.dwell(options.brush_reload_dwell)
         super().generate_rapid_move(path)
 
     def _prepend_landing(self, path: toolpath.Toolpath) -> None:
         """Prepend a landing strip."""
         first_segment = path[0]
-        start_angle = toolpath.seg_start_angle(first_segment) + math.pi
-        delta = geom2d.P.from_polar(self.options.brush_landing, start_angle)
+        # The landing strip points backwards from the path start.
+        start_angle = toolpath.seg_start_angle(first_segment)
+        landing = self.options.brush_landing
+        x, y = first_segment.p1
         landing_line = toolpath.ToolpathLine(
-            first_segment.p1 + delta, first_segment.p1
+            geom2d.P(
+                x - landing * math.cos(start_angle),
+                y - landing * math.sin(start_angle),
+            ),
+            first_segment.p1,
         )
 
         if hasattr(first_segment, 'inline_start_angle'):
@@ -122,9 +131,14 @@ class PaintCAM(simplecam.SimpleCAM):
         """Append an overshoot line segment."""
         last_segment = path[-1]
         brush_direction = toolpath.seg_end_angle(last_segment)
-        delta = geom2d.P.from_polar(self.options.brush_takeoff, brush_direction)
+        takeoff = self.options.brush_takeoff
+        x, y = last_segment.p2
         takeoff_line = toolpath.ToolpathLine(
-            last_segment.p2, last_segment.p2 + delta
+            last_segment.p2,
+            geom2d.P(
+                x + takeoff * math.cos(brush_direction),
+                y + takeoff * math.sin(brush_direction),
+            ),
         )
 
         if self.options.brush_soft_takeoff:
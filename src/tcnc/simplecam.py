@@ -471,7 +471,9 @@ class SimpleCAM:
                 # For now just treat the f*cked up arc as a line...
                 self.gc.feed(segment.p2.x, segment.p2.y, a=end_angle, z=depth)
             else:
-                arcv = segment.center - segment.p1
+                # Center offset from the position the generator has
+                # actually output, which can differ slightly from p1.
+                arcv = segment.center - pos
                 self.gc.feed_arc(
                     segment.is_clockwise(),
                     segment.p2.x,
@@ -498,15 +498,27 @@ class Tcnc(inkext.InkscapeExtension):
         # logger.debug('gcode output: %s', filepath)
         try:
             with filepath.open('w', encoding='utf-8') as output:
-                gcgen = self._init_gcode(output)
-                cam = self._init_cam(gcgen)
-                cam.generate_gcode(path_list)
+                self._generate_gcode(output, path_list)
         except OSError as error:
             inkext.errormsg(str(error))
 
         total_time = timeit.default_timer() - timer_start
         logger.info('Tcnc time: %s', str(timedelta(seconds=total_time)))
 
+    def _generate_gcode(
+        self,
+        output: TextIO,
+        path_list: Sequence[Sequence[geomsvg.TPathGeom]],
+    ) -> None:
+        """Generate G code for the paths and write it to output."""
+        gcgen = self._init_gcode(output)
+        cam = self._init_cam(gcgen)
+        try:
+            cam.generate_gcode(path_list)
+        finally:
+            # Keep any partial output if something went wrong
+            gcgen.flush()
+
     def _init_gcode(self, output: TextIO) -> gcode.GCodeGenerator:
         """Create and initialize the G code generator with machine details."""
         if self.options.a_feed_match:
@@ -541,6 +553,7 @@ class Tcnc(inkext.InkscapeExtension):
             plotter=preview_plotter,
             output=output,
             target=self.options.gcode_target,
+            buffer_output=True,
         )
         # The 'Z' axis is the rotational tangent axis for this machine
         # (The Valiani/CMC instance of the Rubens6k controller.)
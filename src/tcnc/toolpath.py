@@ -20,6 +20,12 @@ class ToolpathError(Exception):
     """Error processing toolpath."""
 
 
+# Note: The toolpath segment classes can't use __slots__ for the hints.
+# geom2d.Line and geom2d.Arc are tuple subclasses (non-empty __slots__
+# aren't allowed) and hints are optional - their presence is tested
+# with hasattr() - so they live in the instance __dict__.
+
+
 class ToolpathArc(geom2d.Arc):
     """geom2d.Arc with toolpath render hints."""
 
@@ -48,10 +54,12 @@ def toolpath_segment(
 ) -> ToolpathSegment:
     """Create a ToolpathSegment subtype if not already."""
     if not isinstance(segment, (ToolpathLine, ToolpathArc)):
+        # The geom2d segment is already valid so just re-type it,
+        # reusing its points instead of going through __new__.
         if isinstance(segment, geom2d.Line):
-            segment = ToolpathLine(*segment)
+            segment = tuple.__new__(ToolpathLine, segment)
         elif isinstance(segment, geom2d.Arc):
-            segment = ToolpathArc(*segment)
+            segment = tuple.__new__(ToolpathArc, segment)
         else:
             msg = f'Invalid toolpath segment type {type(segment)}'
             raise TypeError(msg)
@@ -143,19 +151,18 @@ class Toolpath(list[ToolpathSegment]):
                     line_flatness=biarc_line_flatness,
                 )
                 for biarc_seg in biarcs:
-                    if isinstance(biarc_seg, geom2d.Arc):
-                        yield ToolpathArc(*biarc_seg)
-                    else:
-                        yield ToolpathLine(*biarc_seg)
+                    yield toolpath_segment(biarc_seg)
             elif isinstance(segment, geom2d.Line):
-                yield ToolpathLine(*segment)
+                # Always a copy, even of a ToolpathLine (or ToolpathArc
+                # below), so render hints aren't shared with the source.
+                yield tuple.__new__(ToolpathLine, segment)
             elif isinstance(segment, geom2d.Arc):
                 if abs(segment.angle) < math.pi / 2:
-                    yield ToolpathArc(*segment)
+                    yield tuple.__new__(ToolpathArc, segment)
                 else:
                     # Keep arcs under 90deg. to simplify toolpath processing.
                     for arc in _subdivide_arc(segment):
-                        yield ToolpathArc(*arc)
+                        yield toolpath_segment(arc)
             elif isinstance(segment, (ToolpathLine, ToolpathArc)):
                 # Already converted segment. Shouldn't happen.
                 yield segment
@@ -180,7 +187,9 @@ class Toolpath(list[ToolpathSegment]):
 
     def is_closed(self) -> bool:
         """Return True if this path forms a closed polygon."""
-        return len(self) >= _MIN_TOOLPATH_LEN and self[0].p1 == self[-1].p2
+        return len(self) >= _MIN_TOOLPATH_LEN and geom2d.point.almost_equal(
+            self[0].p1, self[-1].p2
+        )
 
 
 def _subdivide_arc(arc: geom2d.Arc) -> list[geom2d.Arc]:
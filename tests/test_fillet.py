@@ -0,0 +1,42 @@
+import math
+
+import geom2d
+import geom2d.fillet
+
+from tcnc import fillet, toolpath
+
+
+def _corner_path(len1, len2, deflection):
+    p1 = geom2d.P(100, 0)
+    p0 = p1 - geom2d.P(len1, 0)
+    p2 = p1 + geom2d.P.from_polar(len2, deflection)
+    return toolpath.Toolpath(
+        [toolpath.ToolpathLine(p0, p1), toolpath.ToolpathLine(p1, p2)]
+    )
+
+
+def test_line_fillet():
+    path = _corner_path(10, 10, math.pi / 2)
+    new_path = fillet.fillet_toolpath(path, 1.0)
+    assert len(new_path) == 3
+    farc = new_path[1]
+    expected = geom2d.fillet.create_fillet_arc(path[0], path[1], 1.0)
+    assert farc == expected
+    assert new_path[0].p2 == farc.p1
+    assert new_path[2].p1 == farc.p2
+
+
+def test_line_fillet_cusp():
+    # Near-cusp corner: the lines double back on each other
+    path = _corner_path(100, 1000, math.pi - 9.3e-9)
+    assert fillet.fillet_toolpath(path, 0.05) is path
+    path = _corner_path(100, 1000, -math.pi + 9.3e-9)
+    assert fillet.fillet_toolpath(path, 0.05) is path
+
+
+def test_line_fillet_parallel():
+    # The parallel test is relative to the segment lengths
+    path = _corner_path(1000, 1000, 1e-8)
+    assert fillet._line_fillet_arc(path[0], path[1], 0.05) is None
+    path = _corner_path(0.01, 0.01, 1e-3)
+    assert fillet._line_fillet_arc(path[0], path[1], 0.05) is not None
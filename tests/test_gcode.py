@@ -0,0 +1,134 @@
+import io
+import math
+
+import pytest
+
+from tcnc import gcode
+
+# Tool up to safe height then move to (1, 2)
+RAPID_MOVE = 'G00 Z1.0000000\nG00 X1.0000000 Y2.0000000\n'
+
+
+def _gcgen(output=None, **kwargs):
+    return gcode.GCodeGenerator(100, zsafe=1.0, output=output, **kwargs)
+
+
+def test_unbuffered_output():
+    # Output is written as it is generated, without flush() or footer()
+    with io.TextIOWrapper(io.BytesIO(), encoding='utf-8') as output:
+        gcgen = _gcgen(output)
+        gcgen.rapid_move(1, 2)
+        output.flush()
+        assert output.buffer.getvalue() == RAPID_MOVE.encode()
+
+
+def test_buffered_output():
+    output = io.StringIO()
+    gcgen = _gcgen(output, buffer_output=True)
+    gcgen.rapid_move(1, 2)
+    assert not output.getvalue()
+    gcgen.flush()
+    assert output.getvalue() == RAPID_MOVE
+
+
+def test_binary_output():
+    output = io.BytesIO()
+    gcgen = _gcgen(output)
+    gcgen.rapid_move(1, 2)
+    assert output.getvalue() == RAPID_MOVE.encode('utf-8')
+    output = io.BytesIO()
+    gcgen = _gcgen(output, buffer_output=True)
+    gcgen.rapid_move(1, 2)
+    gcgen.comment('Fläche')
+    gcgen.flush()
+    assert output.getvalue() == (RAPID_MOVE + '; Fläche\n').encode('utf-8')
+
+
+def test_machine_attr():
+    gcgen = _gcgen(target='LinuxCNC')
+    assert gcgen.target == 'linuxcnc'
+    # Not defined by the target: the default target's value
+    assert gcgen.machine_attr('set_units_mm') == 'G21'
+    # ...unless the caller passes a default
+    assert gcgen.machine_attr('set_units_mm', 'M99') == 'M99'
+    gcgen.target = 'rubens6k'
+    assert gcgen.machine_attr('set_units_mm') == 'G71'
+    assert gcgen.machine_attr('set_units_mm', 'M99') == 'G71'
+    assert gcgen.machine_attr('spindle_on_cw') == 'M3'
+    # Unknown targets use the default target
+    gcgen.target = 'unknown'
+    assert gcgen.machine_attr('set_units_mm', 'M99') == 'G21'
+    assert gcgen.machine_attr('undefined') is None
+
+
+def test_feed_arc():
+    output = io.StringIO()
+    gcgen = _gcgen(output)
+    gcgen.rapid_move(1, 0)
+    # Quarter circle about the origin
+    gcgen.feed_arc(False, 0, 1, -1, 0)
+    assert output.getvalue().endswith(
+        'G03 X0.0000000 Y1.0000000 I-1.0000000 J0.0000000 F100.0000000\n'
+    )
+    # End point off the arc, well outside the default tolerance (1e-8)
+    with pytest.raises(gcode.GCodeError, match='Mismatching arc radii'):
+        gcgen.feed_arc(False, -1.000001, 0, 0, -1)
+    # ...but within a looser tolerance
+    gcgen.set_tolerance(1e-5)
+    gcgen.feed_arc(False, -1.000001, 0, 0, -1)
+    assert output.getvalue().endswith(
+        'G03 X-1.0000010 Y0.0000000 I0.0000000 J-1.0000000\n'
+    )
+
+
+@pytest.mark.parametrize(
+    ('angle', 'expected'),
+    [(math.tau * 3 + math.pi / 2, 90), (-math.tau - math.pi / 2, 270)],
+)
+def test_normalize_axis_angle(angle, expected):
+    output = io.StringIO()
+    gcgen = _gcgen(output)
+    gcgen.feed(a=angle, feed=360)
+    gcgen.normalize_axis_angle()
+    lines = output.getvalue().splitlines()
+    assert lines[-1].startswith(f'G92 A={expected:.7f}')
+    assert gcgen.A == pytest.approx(math.radians(expected))
+    # Nothing to do once the angle is within one turn
+    gcgen.normalize_axis_angle()
+    assert output.getvalue().splitlines() == lines
+
+
+@pytest.mark.parametrize(
+    ('clockwise', 'sword'), [(True, 'S1000.00'), (False, 'S-1000.00')]
+)
+def test_rubens6k_spindle_on(clockwise, sword):
+    output = io.StringIO()
+    gcgen = _gcgen(output, target='rubens6k')
+    gcgen.spindle_on(1000, clockwise=clockwise, wait=0)
+    assert output.getvalue().split()[0] == sword
+
+
+def test_feed_rate_only():
+    output = io.StringIO()
+    gcgen = _gcgen(output)
+    # A feed rate without an axis is not output...
+    gcgen.feed(feed=50)
+    assert not output.getvalue()
+    # ...so it must be output with the next move
+    gcgen.feed(1, 0, feed=50)
+    assert output.getvalue() == 'G01 X1.0000000 Y0.0000000 F50.0000000\n'
+
+
+def test_wrapped_angle_unchanged():
+    output = io.StringIO()
+    gcgen = _gcgen(output)
+    gcgen.wrap_angles = True
+    gcgen.feed(a=0.1, feed=360)
+    lines = output.getvalue().splitlines()
+    assert len(lines) == 1
+    # Same angle one turn either way
+    gcgen.feed(a=0.1 + math.tau, feed=360)
+    gcgen.feed(a=0.1 - math.tau, feed=360)
+    assert output.getvalue().splitlines() == lines
+    gcgen.feed(a=0.2, feed=360)
+    assert len(output.getvalue().splitlines()) == 2
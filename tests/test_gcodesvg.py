@@ -0,0 +1,109 @@
+import copy
+import math
+import random
+import re
+
+import geom2d
+import pytest
+from geom2d import polygon
+from inkext import inksvg
+from lxml import etree
+
+from tcnc import gcode, gcodesvg
+
+SVG_DOC = (
+    '<svg xmlns="http://www.w3.org/2000/svg"'
+    ' width="100" height="100" viewBox="0 0 100 100"/>'
+)
+
+
+def _plotter(**kwargs):
+    document = etree.ElementTree(etree.fromstring(SVG_DOC))
+    svg_context = inksvg.InkscapeSVGContext(document)
+    return gcodesvg.SVGPreviewPlotter(
+        svg_context, tool_width=1.0, flip_y_axis=False, **kwargs
+    )
+
+
+def _subpaths(d):
+    """Parse path data made of 'M x,y L x,y' subpaths."""
+    num = r'(-?[\d.e+-]+),(-?[\d.e+-]+)'
+    return [
+        tuple(float(v) for v in m.groups())
+        for m in re.finditer(rf'M {num} L {num}', d)
+    ]
+
+
+def test_tool_marks_one_path_per_style():
+    plotter = _plotter(toolmark_line_interval=2.0, show_toolmarks=True)
+    gcgen = gcode.GCodeGenerator(100, zsafe=1.0, plotter=plotter)
+    gcgen.rapid_move(0, 0, a=0)
+    gcgen.tool_down(-0.1)
+    gcgen.feed(10, 0)
+    gcgen.tool_up()
+    elements = list(plotter.tool_layer)
+    assert len(elements) == 1
+    d = elements[0].get('d')
+    assert d.count('M') == 6
+    marks = _subpaths(d)
+    assert len(marks) == 6
+    for i, (x1, y1, x2, y2) in enumerate(marks):
+        assert x1 == pytest.approx(i * 2.0)
+        assert x2 == pytest.approx(i * 2.0)
+        assert y1 == pytest.approx(0.5)
+        assert y2 == pytest.approx(-0.5)
+
+
+@pytest.mark.parametrize(('adaptive', 'num_marks'), [(False, 2), (True, 16)])
+def test_adaptive_tool_marks(adaptive, num_marks):
+    # A short line that rotates the tool 90 degrees
+    plotter = _plotter(
+        toolmark_line_interval=2.0,
+        toolmark_rotation_interval=0.1,
+        show_toolmarks=True,
+    )
+    plotter.adaptive_toolmarks = adaptive
+    gcgen = gcode.GCodeGenerator(100, zsafe=1.0, plotter=plotter)
+    gcgen.rapid_move(0, 0, a=0)
+    gcgen.tool_down(-0.1)
+    gcgen.feed(1, 0, a=math.pi / 2)
+    gcgen.tool_up()
+    elements = list(plotter.tool_layer)
+    assert len(elements) == 1
+    assert len(_subpaths(elements[0].get('d'))) == num_marks
+
+
+def test_styles_per_instance():
+    cls = gcodesvg.SVGPreviewPlotter
+    class_styles = (
+        copy.deepcopy(cls._style_templates),
+        copy.deepcopy(cls._style_defaults),
+        copy.deepcopy(cls._style_scale_defaults),
+    )
+    small = _plotter(style_scale='small')
+    small_styles = dict(small._styles)
+    large = _plotter(style_scale='large')
+    assert small._styles == small_styles
+    assert large._styles != small_styles
+    # A second plotter with the same scale gets the same styles
+    assert _plotter(style_scale='small')._styles == small_styles
+    assert class_styles == (
+        cls._style_templates,
+        cls._style_defaults,
+        cls._style_scale_defaults,
+    )
+
+
+def test_simplify_polyline_rdp():
+    rng = random.Random(42)
+    for _ in range(200):
+        num_points = rng.randint(0, 200)
+        points = []
+        x = y = 0.0
+        for _ in range(num_points):
+            x += rng.uniform(0, 1)
+            y += rng.uniform(-1, 1)
+            points.append(geom2d.P(x, y))
+        tolerance = rng.choice((0.001, 0.1, 0.5, 2.0))
+        expected = polygon.simplify_polyline_rdp(points, tolerance)
+        assert gcodesvg._simplify_polyline_rdp(points, tolerance) == expected
@@ -0,0 +1,28 @@
+from tcnc import tcnc
+
+FILE_TCNC_BIG = 'files/test_tcnc_big.svg'
+
+ARGS = [
+    '--gcode-units=doc',
+    '--path-close-polygons=true',
+    '--path-split-cusps=true',
+    '--path-tool-fillet=true',
+    '--path-tool-offset=true',
+    '--tolerance=0.000001',
+    '--tool-trail-offset=0.2',
+    '--tool-width=0.3',
+    '--z-depth=-0.2',
+    '--z-step=-0.1',
+]
+
+
+def test_tcnc_big_tolerance(tmp_path):
+    """Arcs must not be rejected because of tool position rounding."""
+    ngc_file = tmp_path / 'output.ngc'
+    tcnc.Tcnc().run(
+        argv=[*ARGS, f'--output-path={ngc_file}', FILE_TCNC_BIG],
+        output=tmp_path / 'output.svg',
+    )
+    gcode_lines = ngc_file.read_text().splitlines()
+    assert gcode_lines[-1] == '%'
+    assert any(' G02 ' in line or ' G03 ' in line for line in gcode_lines)
@@ -0,0 +1,18 @@
+import geom2d
+
+from tcnc import toolpath
+
+
+def test_toolpath_iter_copies_segments():
+    line = toolpath.ToolpathLine(geom2d.P(0, 0), geom2d.P(1, 0))
+    line.inline_z = 1.0
+    arc = toolpath.ToolpathArc(
+        geom2d.P(1, 0), geom2d.P(0, 1), 1.0, 1.5707, geom2d.P(0, 0)
+    )
+    segs = list(toolpath.Toolpath.toolpath_iter([line, arc]))
+    assert segs == [line, arc]
+    assert segs[0] is not line
+    assert segs[1] is not arc
+    assert isinstance(segs[0], toolpath.ToolpathLine)
+    assert isinstance(segs[1], toolpath.ToolpathArc)
+    assert not hasattr(segs[0], 'inline_z')